@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+emitter-loadtest.py - Measure hook status emitter overhead
+
+Starts a local stand-in for the monitor server's /log endpoint and drives
+emit_hook_status/emit_agent_status from many concurrent hook processes,
+the way 20-50 hooks fire during a single Claude Code turn.
+
+Scenarios:
+- fast:       server answers immediately
+- slow:       server answers after --latency-ms
+- overloaded: server handles --capacity requests at a time, each slower
+              than the emitter timeout
+- absent:     nothing listens on the port (connection refused)
+
+Reports per-emit latency percentiles, lost events (emits that failed on the
+hook side: timeouts, refusals, HTTP errors), events the server still stored
+after the hook gave up, and the wall-clock time emitting added to each turn.
+Runs fully offline.
+
+Usage:
+    python3 emitter-loadtest.py
+    python3 emitter-loadtest.py --hooks 20,50 --turns 10 --scenarios fast,slow
+    python3 emitter-loadtest.py --error-rate 0.2 --json
+"""
+
+import json
+import random
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, List, Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'hooks'))
+import hook_status_emitter  # noqa: E402
+
+SCENARIOS = ['fast', 'slow', 'overloaded', 'absent']
+EMITS_PER_HOOK = 3  # RUNNING, OK and one agent status
+
+
+class _LogHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Match Node's default listen backlog so the stand-in is not the bottleneck
+    request_queue_size = 511
+
+
+class StandInServer:
+    """Local /log endpoint with injectable latency, errors and overload"""
+
+    def __init__(self, latency_ms: float = 0, error_rate: float = 0.0,
+                 capacity: int = 0):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.accepted = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(capacity) if capacity else None
+
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                with owner._lock:
+                    owner.in_flight += 1
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    body = self.rfile.read(length)
+                    if owner._slots:
+                        owner._slots.acquire()
+                    try:
+                        if owner.latency_ms:
+                            time.sleep(owner.latency_ms / 1000)
+                    finally:
+                        if owner._slots:
+                            owner._slots.release()
+
+                    if self.path != '/log' or random.random() < owner.error_rate:
+                        status = 500
+                    else:
+                        try:
+                            json.loads(body)
+                            status = 200
+                        except json.JSONDecodeError:
+                            status = 400
+
+                    with owner._lock:
+                        if status == 200:
+                            owner.accepted += 1
+                        else:
+                            owner.rejected += 1
+
+                    payload = b'{"ok": true}' if status == 200 else b'{"error": "injected"}'
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Client gave up (emitter timeout)
+                finally:
+                    with owner._lock:
+                        owner.in_flight -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = _LogHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_port}/log'
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def drain(self, timeout: float) -> int:
+        """Wait for requests still being handled after clients timed out.
+
+        Returns how many were still in flight when the timeout expired.
+        """
+        deadline = time.time() + timeout
+        while True:
+            with self._lock:
+                in_flight = self.in_flight
+            if not in_flight or time.time() >= deadline:
+                return in_flight
+            time.sleep(0.05)
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def refused_url() -> str:
+    """URL of a local port nothing is listening on"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    return f'http://127.0.0.1:{port}/log'
+
+
+def _simulate_hook(task: tuple) -> List[tuple]:
+    """One hook process: wait for the turn to start, then emit like a hook does.
+
+    Returns (latency_ms, delivered) per emit.
+    """
+    url, hook_id, start_at = task
+    hook_status_emitter.MONITOR_URL = url
+    hook_name = f'loadtest-hook-{hook_id}'
+
+    delay = start_at - time.time()
+    if delay > 0:
+        time.sleep(delay)
+
+    results = []
+    calls = (
+        lambda: hook_status_emitter.emit_hook_status(hook_name, 'RUNNING', 'Starting', 'PreToolUse'),
+        lambda: hook_status_emitter.emit_agent_status(hook_name, 'invoke', details={'load': True}),
+        lambda: hook_status_emitter.emit_hook_status(hook_name, 'OK', 'Passed', 'PreToolUse', duration_ms=1),
+    )
+    for call in calls:
+        t = time.perf_counter()
+        delivered = call()
+        results.append(((time.perf_counter() - t) * 1000, delivered))
+    return results
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_scenario(scenario: str, hooks: int, turns: int, latency_ms: float,
+                 error_rate: float, capacity: int, drain_timeout: float) -> Dict[str, Any]:
+    """Run `turns` turns of `hooks` concurrent hook processes against a scenario"""
+    server = None
+    if scenario == 'absent':
+        url = refused_url()
+    else:
+        if scenario == 'fast':
+            server = StandInServer(0, error_rate)
+        elif scenario == 'slow':
+            server = StandInServer(latency_ms, error_rate)
+        else:
+            # Slower than the emitter's 0.5s timeout and only a few at a time
+            server = StandInServer(max(latency_ms, 600), error_rate, capacity)
+        server.start()
+        url = server.url
+
+    emit_latencies: List[float] = []
+    turn_added_ms: List[float] = []
+    delivered = 0
+    in_flight_at_stop = 0
+
+    try:
+        with Pool(processes=hooks) as pool:
+            # Warm up workers so process startup is not counted as emit time
+            pool.map(time.sleep, [0] * hooks)
+            for _ in range(turns):
+                start_at = time.time() + 0.05
+                per_hook = pool.map(_simulate_hook, [(url, i, start_at) for i in range(hooks)], chunksize=1)
+                for emits in per_hook:
+                    emit_latencies.extend(latency for latency, _ in emits)
+                    delivered += sum(1 for _, ok in emits if ok)
+                # Hooks run concurrently, so the turn waits on the slowest one
+                turn_added_ms.append(max(sum(latency for latency, _ in emits) for emits in per_hook))
+    finally:
+        if server:
+            in_flight_at_stop = server.drain(drain_timeout)
+            server.stop()
+
+    sent = hooks * turns * EMITS_PER_HOOK
+    accepted = server.accepted if server else 0
+    return {
+        'scenario': scenario,
+        'hooks': hooks,
+        'turns': turns,
+        'events_sent': sent,
+        'events_delivered': delivered,
+        # Counted on the hook side: the emit timed out, was refused or got an error
+        'events_lost': sent - delivered,
+        # Stored by the server after the hook had already given up
+        'late_accepted': max(0, accepted - delivered),
+        # Still queued on the server when the drain timeout expired
+        'in_flight_at_stop': in_flight_at_stop,
+        'emit_ms': {
+            'p50': round(percentile(emit_latencies, 50), 2),
+            'p90': round(percentile(emit_latencies, 90), 2),
+            'p99': round(percentile(emit_latencies, 99), 2),
+            'max': round(max(emit_latencies, default=0), 2)
+        },
+        'turn_added_ms': {
+            'mean': round(sum(turn_added_ms) / len(turn_added_ms), 2) if turn_added_ms else 0,
+            'max': round(max(turn_added_ms, default=0), 2)
+        }
+    }
+
+
+def print_table(results: List[Dict[str, Any]]):
+    header = (f"{'scenario':<11} {'hooks':>5} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} "
+              f"{'lost':>11} {'late':>6} {'turn+ms':>9}")
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        e = r['emit_ms']
+        lost = f"{r['events_lost']}/{r['events_sent']}"
+        print(f"{r['scenario']:<11} {r['hooks']:>5} {e['p50']:>8.1f} {e['p90']:>8.1f} "
+              f"{e['p99']:>8.1f} {e['max']:>8.1f} {lost:>11} {r['late_accepted']:>6} "
+              f"{r['turn_added_ms']['mean']:>9.1f}")
+
+
+def main():
+    """Run load test"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Hook status emitter load test')
+    parser.add_argument('--scenarios', type=str, default=','.join(SCENARIOS),
+                        help=f"Comma-separated scenarios ({', '.join(SCENARIOS)})")
+    parser.add_argument('--hooks', type=str, default='20,50',
+                        help='Comma-separated concurrent hook counts')
+    parser.add_argument('--turns', type=int, default=5, help='Turns per scenario')
+    parser.add_argument('--latency-ms', type=float, default=100,
+                        help='Server latency for slow/overloaded scenarios')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--capacity', type=int, default=4,
+                        help='Concurrent requests served in the overloaded scenario')
+    parser.add_argument('--drain-timeout', type=float, default=10,
+                        help='Seconds to wait for queued server requests before counting late events')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    results = []
+    for scenario in scenarios:
+        for hooks in [int(h) for h in args.hooks.split(',') if h.strip()]:
+            results.append(run_scenario(scenario, hooks, args.turns, args.latency_ms,
+                                        args.error_rate, args.capacity, args.drain_timeout))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
+
+
+if __name__ == '__main__':
+    main()
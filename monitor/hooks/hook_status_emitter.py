@@ -31,6 +31,9 @@ def emit_hook_status(hook_name: str, status: str, message: str = '',
         event: Hook event type (UserPromptSubmit, PreToolUse, etc.)
         duration_ms: Execution time in milliseconds
         details: Additional structured data
+    
+    Returns:
+        True if the monitor accepted the event, False otherwise
     """
     entry = {
         'type': 'hook',
@@ -56,8 +59,9 @@ def emit_hook_status(hook_name: str, status: str, message: str = '',
             method='POST'
         )
         urllib.request.urlopen(req, timeout=0.5)
+        return True
     except:
-        pass  # Non-blocking
+        return False  # Non-blocking
 
 
 def emit_agent_status(agent_name: str, action: str, mode: str = 'execute',
@@ -85,8 +89,9 @@ def emit_agent_status(agent_name: str, action: str, mode: str = 'execute',
             method='POST'
         )
         urllib.request.urlopen(req, timeout=0.5)
+        return True
     except:
-        pass
+        return False
 
 
 def emit_intent(prompt: str, route: str, confidence: int, 
@@ -111,8 +116,9 @@ def emit_intent(prompt: str, route: str, confidence: int,
             method='POST'
         )
         urllib.request.urlopen(req, timeout=0.5)
+        return True
     except:
-        pass
+        return False
 
 
 def emit_error(source: str, message: str, stack: str = None):
@@ -136,8 +142,9 @@ def emit_error(source: str, message: str, stack: str = None):
             method='POST'
         )
         urllib.request.urlopen(req, timeout=0.5)
+        return True
     except:
-        pass
+        return False
 
 
 # CLI interface
@@ -25,6 +25,9 @@ import os
 import time
 import threading
 import re
+import mmap
+import struct
+import fcntl
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import deque
@@ -38,6 +41,7 @@ MONITOR_LOG = LOG_DIR / 'monitor.jsonl'
 ANOMALY_LOG = LOG_DIR / 'anomalies.jsonl'
 ENFORCEMENT_LOG = LOG_DIR / 'enforcement.jsonl'
 MONITOR_STATE = LOG_DIR / 'monitor-state.json'
+LOG_FORMAT = os.environ.get('CLAUDE_LOG_FORMAT', 'jsonl')  # 'jsonl' or 'binary'
 
 # Thresholds
 COMPLEXITY_THRESHOLD = 3  # Complexity score requiring orchestration
@@ -46,6 +50,17 @@ COLLAB_PHRASES = ['can we', "let's", 'how do we', 'help me', 'figure out', 'work
 HOOK_TIMEOUT_MS = 5000
 AGENT_TIMEOUT_MS = 60000
 
+# In-memory history (compact records, see EventRecord/ViolationRecord).
+# Defaults keep memory at the level of the old 500 event dicts / 1000
+# Violations: an EventRecord is ~140B vs ~1.8KB per event dict, but old
+# HOOK_BLOCKED violations shared their event with the buffer and a
+# ViolationRecord only saves ~1.6x, so the violation history keeps its size.
+EVENT_BUFFER_SIZE = int(os.environ.get('CLAUDE_MONITOR_EVENT_BUFFER', 2000))
+VIOLATION_HISTORY_SIZE = int(os.environ.get('CLAUDE_MONITOR_VIOLATION_HISTORY', 1000))
+MAX_NAME_LEN = 64  # Strings up to this length are interned
+MAX_CONTEXT_STR = 200
+MAX_CONTEXT_ITEMS = 20
+
 
 class Severity(Enum):
     INFO = 'info'
@@ -71,6 +86,67 @@ class Violation:
     action_taken: Action = Action.LOG
 
 
+def compact_str(value: Any) -> Optional[str]:
+    """Intern short strings (hook/agent/tool names, statuses), truncate long ones"""
+    if not isinstance(value, str):
+        return None
+    if len(value) <= MAX_NAME_LEN:
+        return sys.intern(value)
+    return value[:MAX_CONTEXT_STR]
+
+
+def compact_context(context: Dict[str, Any], depth: int = 0) -> Dict[str, Any]:
+    """Copy of a violation context with long strings, lists and nesting trimmed"""
+    out = {}
+    for key, value in context.items():
+        if value is None or isinstance(value, (bool, int, float)):
+            out[key] = value
+        elif isinstance(value, str):
+            # Nested payloads (e.g. the blocked event) keep only short fields
+            if depth == 0 or len(value) <= MAX_NAME_LEN:
+                out[key] = compact_str(value)
+        elif isinstance(value, (list, tuple)):
+            out[key] = tuple(
+                compact_str(v) if isinstance(v, str) else v
+                for v in value[-MAX_CONTEXT_ITEMS:]
+                if v is None or isinstance(v, (str, bool, int, float))
+            )
+        elif isinstance(value, dict) and depth < 1:
+            out[key] = compact_context(value, depth + 1)
+    return out
+
+
+class EventRecord:
+    """Compact buffered event: timestamp, interned names and small fields only"""
+    
+    __slots__ = ('timestamp', 'type', 'source', 'hook', 'agent', 'tool', 'status', 'duration')
+    
+    def __init__(self, event: Dict):
+        self.timestamp = event.get('timestamp')
+        self.type = compact_str(event.get('type'))
+        self.source = compact_str(event.get('source'))
+        self.hook = compact_str(event.get('hook'))
+        self.agent = compact_str(event.get('agent'))
+        self.tool = compact_str(event.get('tool'))
+        self.status = compact_str(event.get('status'))
+        duration = event.get('duration')
+        self.duration = duration if isinstance(duration, (int, float)) else None
+
+
+class ViolationRecord:
+    """Compact violation kept in history; context is trimmed by compact_context"""
+    
+    __slots__ = ('timestamp', 'severity', 'rule', 'message', 'action_taken', 'context')
+    
+    def __init__(self, v: Violation):
+        self.timestamp = v.timestamp
+        self.severity = v.severity
+        self.rule = compact_str(v.rule)
+        self.message = compact_str(v.message)
+        self.action_taken = v.action_taken
+        self.context = compact_context(v.context)
+
+
 @dataclass 
 class ExecutionContext:
     """Track current execution state"""
@@ -133,7 +209,7 @@ class ProtocolEnforcer:
     
     def __init__(self):
         self.context = ExecutionContext()
-        self.violation_history = deque(maxlen=1000)
+        self.violation_history = deque(maxlen=VIOLATION_HISTORY_SIZE)
         
     def analyze_prompt(self, prompt: str) -> Dict[str, Any]:
         """Analyze prompt for complexity and requirements"""
@@ -324,7 +400,7 @@ class ProtocolEnforcer:
         # Store violations
         for v in violations:
             self.context.violations.append(v)
-            self.violation_history.append(v)
+            self.violation_history.append(ViolationRecord(v))
         
         return violations
 
@@ -333,13 +409,13 @@ class AnomalyDetector:
     """Detects anomalous patterns in execution"""
     
     def __init__(self):
-        self.event_buffer = deque(maxlen=500)
+        self.event_buffer = deque(maxlen=EVENT_BUFFER_SIZE)
         self.hook_timings: Dict[str, List[int]] = {}
         self.error_counts: Dict[str, int] = {}
         self.last_check = time.time()
     
     def add_event(self, event: Dict):
-        self.event_buffer.append(event)
+        self.event_buffer.append(EventRecord(event))
         
         # Track hook timings
         if event.get('type') == 'hook' and 'duration' in event:
@@ -355,6 +431,26 @@ class AnomalyDetector:
             source = event.get('source') or event.get('hook') or 'unknown'
             self.error_counts[source] = self.error_counts.get(source, 0) + 1
     
+    def buffer_summary(self) -> Dict[str, Any]:
+        """Event counts over the buffered window"""
+        by_type: Dict[str, int] = {}
+        failures_by_source: Dict[str, int] = {}
+        first = last = None
+        for e in self.event_buffer:
+            by_type[e.type or 'unknown'] = by_type.get(e.type or 'unknown', 0) + 1
+            # Same failure rule and source as add_event's error clustering
+            if e.type == 'error' or e.status in ('ERROR', 'BLOCKED'):
+                source = e.source or e.hook or 'unknown'
+                failures_by_source[source] = failures_by_source.get(source, 0) + 1
+            if isinstance(e.timestamp, (int, float)):
+                first = e.timestamp if first is None else min(first, e.timestamp)
+                last = e.timestamp if last is None else max(last, e.timestamp)
+        return {
+            'events_by_type': by_type,
+            'failures_by_source': failures_by_source,
+            'span_ms': (last - first) if first is not None else 0
+        }
+    
     def check_anomalies(self) -> List[Dict]:
         """Check for anomalous patterns"""
         anomalies = []
@@ -395,29 +491,452 @@ class AnomalyDetector:
         return anomalies
 
 
+# Compact binary segment format (.clog)
+#
+#   header:  b'CLOG' | u8 version | 3 pad bytes
+#   record:  u32 payload length | payload
+#   payload: u8 kind, then
+#     KIND_STRING: u16 id | utf-8 string           (intern table entry)
+#     KIND_EVENT:  i64 timestamp | i64 received | i64 duration | u16 id per
+#                  INTERNED_FIELDS entry | compact JSON of remaining fields
+#                  (may be empty)
+#
+# String ids are assigned per segment in order of first use and defined
+# inline before the first event that references them, so segments stay
+# append-only and can be read front to back without a separate index.
+CLOG_MAGIC = b'CLOG'
+CLOG_VERSION = 3
+KIND_STRING = 0
+KIND_EVENT = 1
+NO_STRING = 0xFFFF
+NO_TIMESTAMP = -1
+NO_DURATION = -2 ** 63
+# Hook events plus the fields of enforcement and anomaly log entries
+INTERNED_FIELDS = ('type', 'hook', 'agent', 'tool', 'status', 'event', 'message',
+                   'severity', 'rule', 'action', 'source')
+TIMESTAMP_FIELDS = ('timestamp', 'received')
+MAX_INTERNED_LEN = 255
+
+_CLOG_HEADER = struct.Struct('<4sB3x')
+_CLOG_LENGTH = struct.Struct('<I')
+_CLOG_STRING = struct.Struct('<BH')
+_CLOG_EVENT_TIMES = struct.Struct('<xqqq')  # Kind and fixed-width fields
+_CLOG_EVENT_NAMES = struct.Struct(f'<{_CLOG_EVENT_TIMES.size}x{len(INTERNED_FIELDS)}H')  # String ids
+_CLOG_EVENT = struct.Struct(f'<Bqqq{len(INTERNED_FIELDS)}H')
+
+
+class SegmentWriter:
+    """
+    Appends events to a binary log segment.
+    
+    Several writers (e.g. monitor agents in different processes) may share a
+    segment: each append holds an exclusive flock on it and first loads the
+    intern entries other writers added since this writer's last append, so
+    string ids stay consistent across writers.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._open()
+    
+    def _open(self):
+        self._ids: Dict[str, int] = {}
+        self._end = _CLOG_HEADER.size  # Offset up to which intern entries are loaded
+        self._file = open(self.path, 'a+b')
+        fd = self._file.fileno()
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_size < _CLOG_HEADER.size:
+                # New segment, or one interrupted while writing the header
+                os.ftruncate(fd, 0)
+                self._file.write(_CLOG_HEADER.pack(CLOG_MAGIC, CLOG_VERSION))
+                self._file.flush()
+            elif _CLOG_HEADER.unpack(os.pread(fd, _CLOG_HEADER.size, 0)) != (CLOG_MAGIC, CLOG_VERSION):
+                self._file.close()
+                raise ValueError(f"Not a binary log segment: {self.path}")
+            self._catch_up()
+        finally:
+            if not self._file.closed:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    
+    def _catch_up(self):
+        """Load intern entries appended after self._end. Caller holds the lock."""
+        fd = self._file.fileno()
+        size = os.fstat(fd).st_size
+        if size <= self._end:
+            return
+        data = os.pread(fd, size - self._end, self._end)
+        end = len(data)
+        pos = 0
+        ids = self._ids
+        length_size = _CLOG_LENGTH.size
+        
+        while pos + length_size <= end:
+            (length,) = _CLOG_LENGTH.unpack_from(data, pos)
+            start = pos + length_size
+            if length == 0 or start + length > end:
+                break
+            if data[start] == KIND_STRING:
+                _, sid = _CLOG_STRING.unpack_from(data, start)
+                if sid == len(ids):
+                    ids[str(data[start + _CLOG_STRING.size:start + length], 'utf-8')] = sid
+            pos = start + length
+        
+        self._end += pos
+        if pos < end:
+            # Drop a partial record left by an interrupted write, otherwise new
+            # records would be read as its payload
+            os.ftruncate(fd, self._end)
+    
+    def _intern(self, value: Any, out: bytearray) -> int:
+        """Return the id for value, defining it in `out` on first use"""
+        if not isinstance(value, str) or len(value) > MAX_INTERNED_LEN:
+            return NO_STRING
+        sid = self._ids.get(value)
+        if sid is None:
+            if len(self._ids) >= NO_STRING:
+                return NO_STRING
+            sid = len(self._ids)
+            self._ids[value] = sid
+            data = _CLOG_STRING.pack(KIND_STRING, sid) + value.encode('utf-8')
+            out += _CLOG_LENGTH.pack(len(data)) + data
+        return sid
+    
+    def append(self, entry: Dict):
+        """Append a single event"""
+        while True:
+            fd = self._file.fileno()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                current = os.stat(self.path).st_ino == os.fstat(fd).st_ino
+            except FileNotFoundError:
+                current = False
+            if current:
+                break
+            # Another writer rotated the segment into the archive; follow it
+            self._file.close()
+            self._open()
+        
+        try:
+            self._catch_up()
+            count = len(self._ids)
+            try:
+                out = self._encode(entry)
+                self._file.write(out)
+                self._file.flush()
+            except BaseException:
+                # Forget ids whose definitions were never written
+                self._ids = {name: sid for name, sid in self._ids.items() if sid < count}
+                raise
+            self._end += len(out)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    
+    def _encode(self, entry: Dict) -> bytearray:
+        """Encode entry, preceded by definitions of strings it interns first"""
+        out = bytearray()
+        extra = dict(entry)
+        
+        ids = []
+        for name in INTERNED_FIELDS:
+            sid = self._intern(entry.get(name), out)
+            if sid != NO_STRING:
+                del extra[name]
+            ids.append(sid)
+        
+        timestamps = []
+        for name in TIMESTAMP_FIELDS:
+            ts = entry.get(name)
+            if type(ts) is int and 0 <= ts < 2 ** 63:
+                del extra[name]
+            else:
+                ts = NO_TIMESTAMP
+            timestamps.append(ts)
+        
+        duration = entry.get('duration')
+        if type(duration) is int and NO_DURATION < duration < 2 ** 63:
+            del extra['duration']
+        else:
+            duration = NO_DURATION
+        
+        tail = json.dumps(extra, separators=(',', ':')).encode('utf-8') if extra else b''
+        head = _CLOG_EVENT.pack(KIND_EVENT, *timestamps, duration, *ids)
+        out += _CLOG_LENGTH.pack(len(head) + len(tail)) + head + tail
+        return out
+    
+    def close(self):
+        self._file.close()
+
+
+class SegmentReader:
+    """
+    Reads a binary log segment through mmap (compressed .clog.gz archives are
+    decompressed into memory instead).
+    
+    iter_records() yields (timestamp, received, duration, *names, extra)
+    tuples where names follow INTERNED_FIELDS as the interned str objects
+    (None when absent) and extra is a memoryview
+    into the mapping, so no record bytes are copied. Views stay usable after
+    close() if still referenced; the mapping is released once they are gone.
+    Iterating the reader itself yields dicts.
+    
+    After iteration, valid_end is the offset just past the last complete record.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.strings: List[str] = []
+        self._file = open(self.path, 'rb')
+        self._map = None
+        self._view = None
+        self.valid_end = _CLOG_HEADER.size
+        
+        if self.path.suffix == '.gz':
+            import gzip
+            with self._file:
+                data = gzip.decompress(self._file.read())
+        else:
+            if os.fstat(self._file.fileno()).st_size < _CLOG_HEADER.size:
+                self._file.close()
+                raise ValueError(f"Not a binary log segment: {self.path}")
+            data = self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(data) < _CLOG_HEADER.size:
+            self.close()
+            raise ValueError(f"Not a binary log segment: {self.path}")
+        magic, version = _CLOG_HEADER.unpack_from(data, 0)
+        if magic != CLOG_MAGIC or version != CLOG_VERSION:
+            self.close()
+            raise ValueError(f"Not a binary log segment: {self.path}")
+        self._view = memoryview(data)
+    
+    def iter_records(self):
+        """Yield raw event tuples without copying record payloads"""
+        buf = self._view
+        end = len(buf)
+        pos = _CLOG_HEADER.size
+        strings = self.strings
+        names = {NO_STRING: None}
+        unpack_length = _CLOG_LENGTH.unpack_from
+        unpack_times = _CLOG_EVENT_TIMES.unpack_from
+        unpack_names = _CLOG_EVENT_NAMES.unpack_from
+        length_size = _CLOG_LENGTH.size
+        event_size = _CLOG_EVENT.size
+        
+        while pos + length_size <= end:
+            (length,) = unpack_length(buf, pos)
+            start = pos + length_size
+            pos = start + length
+            if pos > end or length == 0:
+                break  # Truncated trailing record (interrupted write)
+            self.valid_end = pos
+            
+            kind = buf[start]
+            if kind == KIND_EVENT:
+                ts, received, duration = unpack_times(buf, start)
+                yield (
+                    None if ts == NO_TIMESTAMP else ts,
+                    None if received == NO_TIMESTAMP else received,
+                    None if duration == NO_DURATION else duration,
+                    *[names.get(sid) for sid in unpack_names(buf, start)],
+                    buf[start + event_size:pos]
+                )
+            elif kind == KIND_STRING:
+                _, sid = _CLOG_STRING.unpack_from(buf, start)
+                if sid == len(strings):
+                    name = str(buf[start + _CLOG_STRING.size:pos], 'utf-8')
+                    strings.append(name)
+                    names[sid] = name
+    
+    def __iter__(self):
+        return self.iter_events()
+    
+    def iter_events(self, types=None):
+        """Yield events as dicts, optionally only those whose type is in `types`.
+
+        Records of other types are skipped without decoding their payload.
+        Each event is a new dict, but events with identical payloads share
+        nested values (e.g. a violation's context), so copy those before
+        modifying them.
+        """
+        buf = self._view
+        end = len(buf)
+        pos = _CLOG_HEADER.size
+        strings = self.strings
+        names = {NO_STRING: None}
+        # Tails are compact JSON objects written by SegmentWriter, so skip the
+        # encoding detection and whitespace handling of json.loads
+        scan = json.JSONDecoder().scan_once
+        unpack_length = _CLOG_LENGTH.unpack_from
+        unpack_times = _CLOG_EVENT_TIMES.unpack_from
+        unpack_names = _CLOG_EVENT_NAMES.unpack_from
+        length_size = _CLOG_LENGTH.size
+        event_size = _CLOG_EVENT.size
+        # Name combinations and payload tails repeat a lot; build each once
+        templates: Dict[tuple, Dict] = {}
+        tails: Dict[str, Dict] = {}
+        
+        while pos + length_size <= end:
+            (length,) = unpack_length(buf, pos)
+            start = pos + length_size
+            pos = start + length
+            if pos > end or length == 0:
+                break  # Truncated trailing record (interrupted write)
+            
+            kind = buf[start]
+            if kind == KIND_STRING:
+                _, sid = _CLOG_STRING.unpack_from(buf, start)
+                if sid == len(strings):
+                    name = str(buf[start + _CLOG_STRING.size:pos], 'utf-8')
+                    strings.append(name)
+                    names[sid] = name
+                continue
+            if kind != KIND_EVENT:
+                continue
+            
+            ids = unpack_names(buf, start)
+            template = templates.get(ids)
+            if template is None:
+                template = {
+                    field_name: names[sid]
+                    for field_name, sid in zip(INTERNED_FIELDS, ids)
+                    if names.get(sid) is not None
+                }
+                if len(templates) < 65536:
+                    templates[ids] = template
+            if types is not None and template.get('type') not in types:
+                continue
+            
+            event = template.copy()
+            ts, received, duration = unpack_times(buf, start)
+            if ts != NO_TIMESTAMP:
+                event['timestamp'] = ts
+            if received != NO_TIMESTAMP:
+                event['received'] = received
+            if duration != NO_DURATION:
+                event['duration'] = duration
+            if pos > start + event_size:
+                key = str(buf[start + event_size:pos], 'utf-8')
+                fields = tails.get(key)
+                if fields is None:
+                    fields = scan(key, 0)[0]
+                    if len(tails) < 4096:
+                        tails[key] = fields
+                event.update(fields)
+            yield event
+    
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # Caller still holds record views; unmapped when they are freed
+            self._map = None
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_log(path: Path, types=None):
+    """Iterate events from a .jsonl, .jsonl.gz, .clog or .clog.gz log file.
+
+    If `types` is given, only events of those types are returned (non-event
+    JSONL lines such as bare strings are passed through).
+    """
+    path = Path(path)
+    if path.suffix == '.clog' or path.name.endswith('.clog.gz'):
+        with SegmentReader(path) as reader:
+            yield from reader.iter_events(types)
+        return
+    
+    if path.suffix == '.gz':
+        import gzip
+        f = gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    else:
+        f = open(path, 'r', encoding='utf-8', errors='replace')
+    with f:
+        for line in f:
+            if line.strip():
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if types is None or not isinstance(event, dict) or event.get('type') in types:
+                    yield event
+
+
+def convert_log(src: Path, dst: Path) -> int:
+    """Convert between JSONL and binary segments, based on dst suffix"""
+    src, dst = Path(src), Path(dst)
+    count = 0
+    if dst.suffix == '.clog':
+        if dst.exists():
+            dst.unlink()
+        writer = SegmentWriter(dst)
+        try:
+            for event in iter_log(src):
+                if isinstance(event, dict):
+                    writer.append(event)
+                    count += 1
+        finally:
+            writer.close()
+    else:
+        with open(dst, 'w') as f:
+            for event in iter_log(src):
+                f.write(json.dumps(event) + '\n')
+                count += 1
+    return count
+
+
 class LogManager:
     """Manages log storage, rotation, and archival"""
     
     MAX_LOG_SIZE = 10 * 1024 * 1024  # 10MB
     RETENTION_DAYS = 30
     
-    def __init__(self):
+    def __init__(self, log_format: str = LOG_FORMAT):
         LOG_DIR.mkdir(parents=True, exist_ok=True)
         (LOG_DIR / 'archive').mkdir(exist_ok=True)
         (LOG_DIR / 'sessions').mkdir(exist_ok=True)
+        self.binary = log_format == 'binary'
+        self._writers: Dict[Path, SegmentWriter] = {}
     
     def write_log(self, path: Path, entry: Dict):
         """Write entry to log file with rotation"""
+        # monitor.jsonl is tailed by the dashboard server, so it stays JSONL
+        if self.binary and path != MONITOR_LOG:
+            path = path.with_suffix('.clog')
+        
         if path.exists() and path.stat().st_size > self.MAX_LOG_SIZE:
             self._rotate(path)
         
+        if path.suffix == '.clog':
+            writer = self._writers.get(path)
+            if writer is None:
+                writer = self._writers[path] = SegmentWriter(path)
+            writer.append(entry)
+            return
+        
         with open(path, 'a') as f:
             f.write(json.dumps(entry) + '\n')
     
     def _rotate(self, path: Path):
         """Rotate log file"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        archive_path = LOG_DIR / 'archive' / f'{path.stem}_{timestamp}.jsonl'
+        writer = self._writers.pop(path, None)
+        if writer:
+            writer.close()
+        
+        # Archives keep their format: monitor.jsonl archives must stay JSONL
+        # for the dashboard's history pagination
+        archive_path = LOG_DIR / 'archive' / f'{path.stem}_{timestamp}{path.suffix}'
         path.rename(archive_path)
         
         # Compress old archives
@@ -431,7 +950,8 @@ class LogManager:
         cutoff = datetime.now() - timedelta(days=1)
         archive_dir = LOG_DIR / 'archive'
         
-        for f in archive_dir.glob('*.jsonl'):
+        archives = list(archive_dir.glob('*.jsonl')) + list(archive_dir.glob('*.clog'))
+        for f in archives:
             if datetime.fromtimestamp(f.stat().st_mtime) < cutoff:
                 with open(f, 'rb') as src:
                     with gzip.open(f'{f}.gz', 'wb') as dst:
@@ -566,6 +1086,10 @@ class MonitorAgent:
     
     def get_status(self) -> Dict:
         """Get current monitor status"""
+        violations_by_rule: Dict[str, int] = {}
+        for v in self.enforcer.violation_history:
+            violations_by_rule[v.rule] = violations_by_rule.get(v.rule, 0) + 1
+        
         return {
             'running': self.running,
             'context': {
@@ -576,13 +1100,158 @@ class MonitorAgent:
                 'violations': len(self.enforcer.context.violations)
             },
             'violation_count': len(self.enforcer.violation_history),
+            'violations_by_rule': violations_by_rule,
             'anomaly_detector': {
                 'events_buffered': len(self.anomaly_detector.event_buffer),
-                'error_sources': len(self.anomaly_detector.error_counts)
+                'error_sources': len(self.anomaly_detector.error_counts),
+                **self.anomaly_detector.buffer_summary()
             }
         }
 
 
+# Batch analysis (threshold tuning)
+_batch_enforcer: Optional[ProtocolEnforcer] = None
+
+
+def iter_prompts(paths: List[str]):
+    """Yield (timestamp, prompt) pairs from log sources ('-' for stdin).
+
+    Accepts monitor log events ('prompt' events carry 'content', 'intent'
+    events carry 'prompt') as well as bare JSON strings. Other lines are skipped;
+    in binary segments their payloads are not even decoded.
+    """
+    for path in paths:
+        if path == '-':
+            events = iter_stdin_events()
+        else:
+            events = iter_log(Path(path), types=('prompt', 'intent'))
+        for entry in events:
+            if isinstance(entry, str):
+                yield None, entry
+            elif isinstance(entry, dict):
+                if entry.get('type') == 'prompt' and entry.get('content'):
+                    yield entry.get('timestamp'), entry['content']
+                elif isinstance(entry.get('prompt'), str):
+                    yield entry.get('timestamp'), entry['prompt']
+
+
+def iter_stdin_events():
+    """Iterate JSON events from stdin"""
+    for line in sys.stdin:
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                pass
+
+
+def _chunked(items, size: int):
+    """Group an iterable into lists of at most `size` items"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _init_batch_worker():
+    global _batch_enforcer
+    _batch_enforcer = ProtocolEnforcer()
+
+
+def _analyze_chunk(chunk: List[tuple]) -> List[Dict[str, Any]]:
+    """Score one chunk of (index, timestamp, prompt) tuples in a worker"""
+    enforcer = _batch_enforcer or ProtocolEnforcer()
+    results = []
+    for index, timestamp, prompt in chunk:
+        analysis = enforcer.analyze_prompt(prompt)
+        p = prompt.lower()
+        results.append({
+            'index': index,
+            'timestamp': timestamp,
+            'prompt': prompt[:200],
+            **analysis,
+            # Every listed phrase present, not just the first collab match
+            'matched_phrases': {
+                'collab': [phrase for phrase in COLLAB_PHRASES if phrase in p],
+                'multi-step': [word for word in MULTI_STEP_WORDS if word in p]
+            }
+        })
+    return results
+
+
+def rules_triggered(analysis: Dict[str, Any], threshold: int) -> List[str]:
+    """Rules a prompt would trigger at end of turn under `threshold`.
+
+    Assumes no orchestrator or agents were active, i.e. the worst case
+    ProtocolEnforcer.process_event would report for the prompt.
+    """
+    complexity = analysis['complexity']
+    collab = any(s.startswith('collab:') for s in analysis['signals'])
+    rules = []
+    if complexity >= threshold or collab:
+        rules.append('ORCH_REQUIRED')
+    if complexity >= threshold:
+        if analysis['suggested_agents'] and complexity >= 2:
+            rules.append('AGENT_REQUIRED')
+        rules.append('QUALITY_GATE_SKIP')
+    return rules
+
+
+def analyze_batch(paths: List[str], thresholds: List[int], workers: int = None,
+                  chunk_size: int = 1000, out=sys.stdout) -> Dict[str, Any]:
+    """
+    Score prompts from JSONL sources across a process pool.
+
+    Writes one JSON result per prompt to `out` (if given) and returns a
+    summary with the complexity histogram and rule counts per threshold.
+    """
+    from multiprocessing import Pool
+
+    complexity_hist: Dict[int, int] = {}
+    category_hist: Dict[str, int] = {}
+    signal_hist: Dict[str, int] = {}
+    phrase_hist: Dict[str, Dict[str, int]] = {'collab': {}, 'multi-step': {}}
+    rule_hist = {t: {} for t in thresholds}
+    total = 0
+
+    indexed = ((i, ts, prompt) for i, (ts, prompt) in enumerate(iter_prompts(paths)))
+    with Pool(processes=workers, initializer=_init_batch_worker) as pool:
+        for results in pool.imap(_analyze_chunk, _chunked(indexed, chunk_size)):
+            for r in results:
+                total += 1
+                complexity_hist[r['complexity']] = complexity_hist.get(r['complexity'], 0) + 1
+                for s in r['signals']:
+                    # Full signal ('collab:can we', 'multi-step:2') shows which phrase fired
+                    signal_hist[s] = signal_hist.get(s, 0) + 1
+                    category = s.split(':', 1)[0]
+                    category_hist[category] = category_hist.get(category, 0) + 1
+                for group, phrases in r['matched_phrases'].items():
+                    counts = phrase_hist[group]
+                    for phrase in phrases:
+                        counts[phrase] = counts.get(phrase, 0) + 1
+                for t in thresholds:
+                    counts = rule_hist[t]
+                    for rule in rules_triggered(r, t):
+                        counts[rule] = counts.get(rule, 0) + 1
+                if out is not None:
+                    out.write(json.dumps(r) + '\n')
+
+    return {
+        'type': 'batch_summary',
+        'prompts': total,
+        'current_threshold': COMPLEXITY_THRESHOLD,
+        'complexity_histogram': {str(k): complexity_hist[k] for k in sorted(complexity_hist)},
+        'signal_category_histogram': dict(sorted(category_hist.items())),
+        'signal_histogram': dict(sorted(signal_hist.items())),
+        'phrase_histogram': {g: dict(sorted(c.items())) for g, c in phrase_hist.items()},
+        'rules_by_threshold': {str(t): rule_hist[t] for t in thresholds}
+    }
+
+
 def main():
     """Run monitor agent"""
     import argparse
@@ -591,8 +1260,37 @@ def main():
     parser.add_argument('--watch', action='store_true', help='Watch logs continuously')
     parser.add_argument('--status', action='store_true', help='Show current status')
     parser.add_argument('--analyze', type=str, help='Analyze a prompt')
+    parser.add_argument('--analyze-batch', nargs='+', metavar='JSONL',
+                        help="Score prompts from JSONL logs/archives ('-' for stdin)")
+    parser.add_argument('--thresholds', type=str, default='1,2,3,4,5',
+                        help='Comma-separated thresholds to compare (with --analyze-batch)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for --analyze-batch (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=1000,
+                        help='Prompts per worker task for --analyze-batch')
+    parser.add_argument('--summary-only', action='store_true',
+                        help='Only print the --analyze-batch summary')
+    parser.add_argument('--convert', nargs=2, metavar=('SRC', 'DST'),
+                        help='Convert a log between JSONL and binary (.clog) by DST suffix')
     args = parser.parse_args()
     
+    if args.convert:
+        count = convert_log(Path(args.convert[0]), Path(args.convert[1]))
+        print(f"Converted {count} events to {args.convert[1]}")
+        return
+    
+    if args.analyze_batch:
+        thresholds = [int(t) for t in args.thresholds.split(',') if t.strip()]
+        summary = analyze_batch(
+            args.analyze_batch, thresholds,
+            workers=args.workers,
+            chunk_size=max(1, args.chunk_size),
+            out=None if args.summary_only else sys.stdout
+        )
+        # Per-prompt results go to stdout; keep the summary separable
+        print(json.dumps(summary, indent=2), file=sys.stdout if args.summary_only else sys.stderr)
+        return
+    
     monitor = MonitorAgent()
     
     if args.status:
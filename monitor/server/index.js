@@ -3,6 +3,7 @@ const { WebSocketServer } = require('ws');
 const http = require('http');
 const fs = require('fs');
 const path = require('path');
+const zlib = require('zlib');
 const chokidar = require('chokidar');
 
 const app = express();
@@ -25,6 +26,12 @@ if (!LOG_DIR.startsWith(HOME)) {
 }
 
 const LOG_FILE = path.join(LOG_DIR, 'monitor.jsonl');
+const ARCHIVE_DIR = path.join(LOG_DIR, 'archive');
+
+// Backfill: recent lines are kept in memory, older ones are read backwards from EOF
+const RECENT_LINES = 500;
+const WS_BACKFILL_LINES = 100;
+const READ_BLOCK_SIZE = 64 * 1024;
 
 // SECURITY: Allowed log entry types (whitelist)
 const ALLOWED_TYPES = ['hook', 'tool', 'agent', 'orch', 'sub', 'prompt', 'response', 'error', 'system', 'enforcement', 'raw'];
@@ -96,6 +103,250 @@ function sanitizeEntry(entry) {
   return sanitized;
 }
 
+// Fixed-size ring of the most recent raw log lines, fed by the file tailer,
+// with the byte offset of each line in the live log (null once rotated away)
+class RecentLines {
+  constructor(capacity) {
+    this.capacity = capacity;
+    this.clear();
+  }
+
+  clear() {
+    this.lines = new Array(this.capacity);
+    this.offsets = new Array(this.capacity).fill(null);
+    this.start = 0;
+    this.size = 0;
+  }
+
+  push(line, offset = null) {
+    const slot = (this.start + this.size) % this.capacity;
+    this.lines[slot] = line;
+    this.offsets[slot] = offset;
+    if (this.size < this.capacity) {
+      this.size++;
+    } else {
+      this.start = (this.start + 1) % this.capacity;
+    }
+  }
+
+  // Last n lines, oldest first
+  last(n) {
+    const count = Math.min(n, this.size);
+    const out = new Array(count);
+    for (let i = 0; i < count; i++) {
+      out[i] = this.lines[(this.start + this.size - count + i) % this.capacity];
+    }
+    return out;
+  }
+
+  // Offset in the live log of the oldest of the last n lines, or null if the
+  // ring holds fewer lines or some of them predate a rotation
+  offsetOf(n) {
+    if (n < 1 || n > this.size) {
+      return null;
+    }
+    return this.offsets[(this.start + this.size - n) % this.capacity];
+  }
+
+  // The live log was rotated or truncated; keep the lines, drop their offsets
+  forgetOffsets() {
+    this.offsets.fill(null);
+  }
+}
+
+// Scan backwards from byte offset `end` (null = EOF) of a source of `size`
+// bytes, reading it in blocks through readBlock(pos, length) -> Buffer.
+// Returns up to `limit` accepted lines oldest first with the byte offset of
+// each, and the offset of the oldest one, so cost depends on the lines
+// requested, not the source size.
+function scanLinesBackwards(size, readBlock, end, limit, accept) {
+  if (end === null) {
+    end = size;
+  } else if (end > size) {
+    // Cursor issued before the log was cleared or rotated
+    throw new RangeError('Cursor is past the end of the log');
+  }
+
+  const lines = [];
+  const offsets = [];
+  let pos = end;
+  let tail = Buffer.alloc(0); // Bytes after the last newline seen so far
+  let offset = end;
+
+  while (pos > 0 && lines.length < limit) {
+    const length = Math.min(READ_BLOCK_SIZE, pos);
+    pos -= length;
+    const block = readBlock(pos, length);
+    if (block.length < length) {
+      break; // Source shrank while reading
+    }
+    let buf = Buffer.concat([block, tail]);
+
+    let nl;
+    while (lines.length < limit && (nl = buf.lastIndexOf(10)) !== -1) {
+      const line = buf.toString('utf-8', nl + 1).trim();
+      if (line && accept(line)) {
+        lines.push(line);
+        offset = pos + nl + 1;
+        offsets.push(offset);
+      }
+      buf = buf.subarray(0, nl);
+    }
+    tail = buf;
+  }
+
+  // First line of the file has no preceding newline
+  if (pos === 0 && lines.length < limit) {
+    const line = tail.toString('utf-8').trim();
+    if (line && accept(line)) {
+      lines.push(line);
+      offsets.push(0);
+    }
+    offset = 0;
+  }
+  return { lines: lines.reverse(), offsets: offsets.reverse(), offset };
+}
+
+function readLinesBackwards(file, end, limit, accept = () => true) {
+  let fd;
+  try {
+    fd = fs.openSync(file, 'r');
+  } catch (e) {
+    return { lines: [], offsets: [], offset: 0 };
+  }
+
+  try {
+    const readBlock = (pos, length) => {
+      const block = Buffer.alloc(length);
+      const bytesRead = fs.readSync(fd, block, 0, length, pos);
+      return block.subarray(0, bytesRead);
+    };
+    return scanLinesBackwards(fs.fstatSync(fd).size, readBlock, end, limit, accept);
+  } finally {
+    fs.closeSync(fd);
+  }
+}
+
+function endsWithNewline(file, size) {
+  const fd = fs.openSync(file, 'r');
+  try {
+    const last = Buffer.alloc(1);
+    return fs.readSync(fd, last, 0, 1, size - 1) === 1 && last[0] === 10;
+  } finally {
+    fs.closeSync(fd);
+  }
+}
+
+// Decompressed .gz archives, so paging through one unpacks it only once
+const ARCHIVE_CACHE_SIZE = 2;
+const archiveCache = new Map();
+
+function readGzipArchive(file) {
+  const mtimeMs = fs.statSync(file).mtimeMs;
+  const cached = archiveCache.get(file);
+  if (cached && cached.mtimeMs === mtimeMs) {
+    // Refresh LRU position
+    archiveCache.delete(file);
+    archiveCache.set(file, cached);
+    return cached.text;
+  }
+  const text = zlib.gunzipSync(fs.readFileSync(file));
+  archiveCache.set(file, { mtimeMs, text });
+  if (archiveCache.size > ARCHIVE_CACHE_SIZE) {
+    archiveCache.delete(archiveCache.keys().next().value);
+  }
+  return text;
+}
+
+// Rotated monitor logs, newest first (archive names sort by timestamp)
+function listArchives() {
+  try {
+    return fs.readdirSync(ARCHIVE_DIR)
+      .filter(f => /^monitor_\d{8}_\d{6}\.jsonl(\.gz)?$/.test(f))
+      .sort()
+      .reverse()
+      .map(f => path.join('archive', f));
+  } catch (e) {
+    return [];
+  }
+}
+
+// Read lines backwards from a log under LOG_DIR; `end` of null means EOF.
+// Compressed archives cannot be read backwards, so they are unpacked (once).
+function readLogLines(relPath, end, limit, accept) {
+  const full = path.join(LOG_DIR, relPath);
+  if (!relPath.endsWith('.gz')) {
+    return readLinesBackwards(full, end, limit, accept);
+  }
+  const text = readGzipArchive(full);
+  return scanLinesBackwards(text.length, (pos, length) => text.subarray(pos, pos + length), end, limit, accept);
+}
+
+// Cursor = position of the oldest line returned so far, in the live log or an
+// archive; an offset of null means the end of that file
+function encodeCursor(file, offset) {
+  return Buffer.from(JSON.stringify({ f: file, o: offset })).toString('base64url');
+}
+
+function decodeCursor(cursor) {
+  try {
+    const { f, o } = JSON.parse(Buffer.from(String(cursor), 'base64url').toString('utf-8'));
+    // SECURITY: Only positions in known log files are accepted
+    if ((f === 'monitor.jsonl' || listArchives().includes(f)) && (o === null || (Number.isInteger(o) && o >= 0))) {
+      return { file: f, offset: o };
+    }
+  } catch (e) {}
+  return null;
+}
+
+function lineTimestamp(line) {
+  try {
+    return JSON.parse(line).timestamp;
+  } catch (e) {
+    return undefined;
+  }
+}
+
+// Cursor for the lines before `offset` in sources[index], moving on to the
+// next older source at its start
+function cursorBefore(sources, index, offset) {
+  if (offset > 0) {
+    return encodeCursor(sources[index], offset);
+  }
+  return index + 1 < sources.length ? encodeCursor(sources[index + 1], null) : null;
+}
+
+// Page backwards through monitor.jsonl and then the rotated archives
+function readLogPage(limit, { cursor = null, before = null } = {}) {
+  const sources = ['monitor.jsonl', ...listArchives()];
+  let index = 0;
+  let end = null;
+  if (cursor) {
+    index = sources.indexOf(cursor.file);
+    end = cursor.offset;
+  }
+
+  const accept = before === null ? () => true : line => {
+    const ts = lineTimestamp(line);
+    return typeof ts === 'number' && ts < before;
+  };
+
+  let lines = [];
+  let next = null;
+  for (; index < sources.length && lines.length < limit; index++, end = null) {
+    const file = sources[index];
+    if (end === 0) {
+      continue;
+    }
+    const page = readLogLines(file, end, limit - lines.length, accept);
+    lines = page.lines.concat(lines);
+    if (lines.length >= limit) {
+      next = cursorBefore(sources, index, page.offset);
+    }
+  }
+  return { lines, next };
+}
+
 // SECURITY: Check if request is from localhost
 function isLocalhost(req) {
   const ip = req.ip || req.connection.remoteAddress || '';
@@ -131,14 +382,11 @@ wss.on('connection', (ws, req) => {
   console.log(`Client connected from ${ip}. Total: ${clients.size}`);
   
   // Send recent logs on connect (already sanitized when stored)
-  if (fs.existsSync(LOG_FILE)) {
-    const lines = fs.readFileSync(LOG_FILE, 'utf-8').split('\n').filter(Boolean).slice(-100);
-    lines.forEach(line => {
-      try {
-        ws.send(line);
-      } catch (e) {}
-    });
-  }
+  recentLines.last(WS_BACKFILL_LINES).forEach(line => {
+    try {
+      ws.send(line);
+    } catch (e) {}
+  });
   
   ws.on('close', () => {
     clients.delete(ws);
@@ -146,31 +394,79 @@ wss.on('connection', (ws, req) => {
   });
 });
 
-// Watch log file for changes
+// Watch log file for changes. lastSize is the end of the last complete line
+// read; a line still being written is held back until its newline arrives.
 let lastSize = 0;
+let logGeneration = 0; // Bumped when the log is cleared under a pending read
+let tailing = false;
+let tailAgain = false;
+const recentLines = new RecentLines(RECENT_LINES);
 if (fs.existsSync(LOG_FILE)) {
   lastSize = fs.statSync(LOG_FILE).size;
+  const { lines, offsets } = readLinesBackwards(LOG_FILE, lastSize, RECENT_LINES);
+  if (lines.length && !endsWithNewline(LOG_FILE, lastSize)) {
+    lines.pop();
+    lastSize = offsets.pop();
+  }
+  lines.forEach((line, i) => recentLines.push(line, offsets[i]));
 }
 
-chokidar.watch(LOG_FILE, { persistent: true }).on('change', () => {
+function tailLog() {
+  if (tailing) {
+    tailAgain = true; // Read again once the pending read finished
+    return;
+  }
   const stat = fs.statSync(LOG_FILE);
-  if (stat.size > lastSize) {
-    const stream = fs.createReadStream(LOG_FILE, { start: lastSize, encoding: 'utf-8' });
-    let buffer = '';
-    stream.on('data', chunk => buffer += chunk);
-    stream.on('end', () => {
-      buffer.split('\n').filter(Boolean).forEach(line => {
+  if (stat.size < lastSize) {
+    // File was rotated or truncated; the ring keeps the older history
+    lastSize = 0;
+    recentLines.forgetOffsets();
+  }
+  if (stat.size <= lastSize) {
+    return;
+  }
+
+  tailing = true;
+  const start = lastSize;
+  const generation = logGeneration;
+  const chunks = [];
+  const done = () => {
+    tailing = false;
+    if (tailAgain) {
+      tailAgain = false;
+      tailLog();
+    }
+  };
+  const stream = fs.createReadStream(LOG_FILE, { start, end: stat.size - 1 });
+  stream.on('data', chunk => chunks.push(chunk));
+  stream.on('error', done);
+  stream.on('end', () => {
+    if (generation !== logGeneration) {
+      return done();
+    }
+    const buffer = Buffer.concat(chunks);
+    const complete = buffer.lastIndexOf(10) + 1;
+    let pos = 0;
+    while (pos < complete) {
+      const nl = buffer.indexOf(10, pos);
+      const line = buffer.toString('utf-8', pos, nl);
+      if (line) {
+        recentLines.push(line, start + pos);
         try {
           const parsed = JSON.parse(line);
           broadcast(parsed);
         } catch (e) {
           broadcast({ type: 'raw', content: escapeHtml(line), timestamp: Date.now() });
         }
-      });
-    });
-    lastSize = stat.size;
-  }
-});
+      }
+      pos = nl + 1;
+    }
+    lastSize = start + complete;
+    done();
+  });
+}
+
+chokidar.watch(LOG_FILE, { persistent: true }).on('change', tailLog);
 
 // API endpoint to receive logs from hooks
 app.use(express.json({ limit: '50kb' })); // SECURITY: Limit request size
@@ -206,12 +502,47 @@ app.post('/log', localhostOnly, (req, res) => {
 });
 
 // API to get recent logs
+// Query: limit (max 500), before (timestamp ms), cursor (from X-Next-Cursor)
+// Only the cursor and before pages reach into rotated archives; the cursor
+// for the next page is returned in X-Next-Cursor
 app.get('/api/logs', localhostOnly, (req, res) => {
   const limit = Math.min(parseInt(req.query.limit) || 100, 500);
-  if (!fs.existsSync(LOG_FILE)) {
-    return res.json([]);
+  const before = req.query.before !== undefined ? Number(req.query.before) : null;
+  let cursor = null;
+  if (req.query.cursor !== undefined) {
+    cursor = decodeCursor(req.query.cursor);
+    if (!cursor) {
+      return res.status(400).json({ error: 'Invalid cursor' });
+    }
+  }
+  if (before !== null && !Number.isFinite(before)) {
+    return res.status(400).json({ error: 'Invalid before timestamp' });
+  }
+
+  let lines;
+  let next = null;
+  if (!cursor && before === null) {
+    // Latest lines come from the live log only; archives are reached through
+    // the returned cursor
+    const ringOffset = recentLines.offsetOf(limit);
+    const page = ringOffset !== null
+      ? { lines: recentLines.last(limit), offset: ringOffset }
+      : readLinesBackwards(LOG_FILE, null, limit);
+    lines = page.lines;
+    next = cursorBefore(['monitor.jsonl', ...listArchives()], 0, page.offset);
+  } else {
+    try {
+      ({ lines, next } = readLogPage(limit, { cursor, before }));
+    } catch (e) {
+      if (e instanceof RangeError) {
+        return res.status(400).json({ error: 'Stale cursor, restart from the latest logs' });
+      }
+      throw e;
+    }
+  }
+  if (next) {
+    res.set('X-Next-Cursor', next);
   }
-  const lines = fs.readFileSync(LOG_FILE, 'utf-8').split('\n').filter(Boolean).slice(-limit);
   res.json(lines.map(l => { try { return JSON.parse(l); } catch { return { type: 'raw', content: escapeHtml(l) }; } }));
 });
 
@@ -224,6 +555,8 @@ app.post('/api/logs/clear', localhostOnly, (req, res) => {
   
   fs.writeFileSync(LOG_FILE, '');
   lastSize = 0;
+  logGeneration++;
+  recentLines.clear();
   broadcast({ type: 'system', action: 'clear', timestamp: Date.now() });
   res.json({ ok: true, cleared: true });
 });